@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""Check that the generators still produce the pinned output sets, fast enough.
+
+Runs four kinds of checks and exits non-zero if any fails:
+
+- oracles: the output set of `password_generator.generate_variations`,
+  `chatgpt.generate_combinations`, `chatgpt2.generate_combinations` and
+  `multi_target.generate_multi` for a fixed, seeded list of random
+  name/phone/symbol inputs is hashed and compared with `generator_oracles.json`.
+- fast paths: `generate_variations_bytes` must equal `generate_variations`,
+  and the compiled `join_product` (if built) must equal the Python fallback
+  for `bytes`, `bytearray` and `memoryview` tokens, and both must reject
+  non-contiguous buffers.
+- wordlist index: an external-sort build with tiny chunks under a low open
+  file limit must succeed and answer lookups like a set.
+- performance: each benchmark's speed is measured as a ratio against a fixed
+  reference loop timed in the same run, interleaved with it, so machine speed
+  and load cancel out. That ratio and the tracemalloc peak memory must stay
+  within `--max-slowdown` and `--max-memory-growth` of the values pinned in
+  `generator_benchmarks.json` for the active `fastjoin` backend (compiled
+  extension or pure Python).
+
+Note that `generate_variations` currently ignores its `symbols` argument; the
+oracles pin that behaviour, so fixing it will show up as an oracle change.
+
+The two files are re-pinned separately. After an intentional output change:
+
+    python check_generators.py --update-oracles
+
+After an intentional performance change, or after building or removing the
+extension:
+
+    python check_generators.py --update-benchmarks
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import chatgpt
+import chatgpt2
+import fastjoin
+import multi_target
+import wordlist_index
+from password_generator import generate_variations, generate_variations_bytes
+
+ORACLE_FILE = Path(__file__).with_name("generator_oracles.json")
+BENCHMARK_FILE = Path(__file__).with_name("generator_benchmarks.json")
+
+SEED = 20240601
+CASES = 60
+NAME_CHARS = "abcdefghijklmnopqrstuvwxyzSOURAV éß"
+PHONE_CHARS = "0123456789 +-()"
+SYMBOL_CHARS = "@_!#$*.-é"
+
+MAX_SLOWDOWN = 2.0
+MAX_MEMORY_GROWTH = 1.5
+BENCH_REPEAT = 5
+# each timing sample loops the workload for at least this long
+BENCH_MIN_TIME = 0.05
+# --update-benchmarks pins the slowest of this many measurements
+PIN_ROUNDS = 3
+
+
+def make_cases(seed: int = SEED, count: int = CASES) -> list:
+    """Return a reproducible list of [name, phone, symbols] inputs."""
+    rng = random.Random(seed)
+    cases = [["sourav", "9876543210", None], ["Sourav", "", ["*"]], ["ab", None, None]]
+    while len(cases) < count:
+        name = "".join(rng.choice(NAME_CHARS) for _ in range(rng.randint(0, 10)))
+        phone = rng.choice([None, ""]) if rng.random() < 0.2 else "".join(
+            rng.choice(PHONE_CHARS) for _ in range(rng.randint(1, 14))
+        )
+        symbols = None if rng.random() < 0.5 else list({rng.choice(SYMBOL_CHARS) for _ in range(rng.randint(0, 4))})
+        cases.append([name, phone, sorted(symbols) if symbols is not None else None])
+    return cases
+
+
+def multi_target_output(name: str, phone: str | None, symbols: list | None) -> set:
+    groups = multi_target.build_groups(names=[name, name[::-1]], dates=["14/03/1995"], phones=[phone or ""])
+    return set(multi_target.generate_multi(groups, separators=[""] + (symbols or []), limit=None))
+
+
+GENERATORS = {
+    "generate_variations": lambda n, p, s: generate_variations(n, p, s),
+    "chatgpt.generate_combinations": lambda n, p, s: set(chatgpt.generate_combinations(n, p)),
+    "chatgpt2.generate_combinations": lambda n, p, s: set(chatgpt2.generate_combinations(n, p)),
+    "multi_target.generate_multi": multi_target_output,
+}
+
+
+def digest(items) -> str:
+    h = hashlib.sha256()
+    for it in sorted(x.encode("utf-8") if isinstance(x, str) else x for x in items):
+        h.update(it)
+        h.update(b"\n")
+    return h.hexdigest()
+
+
+def compute_oracles(cases: list) -> dict:
+    return {
+        name: [[*case, digest(gen(*case))] for case in cases]
+        for name, gen in GENERATORS.items()
+    }
+
+
+def check_oracles(pinned: dict, cases: list) -> list:
+    failures = []
+    current = compute_oracles(cases)
+    for name, rows in current.items():
+        if name not in pinned:
+            failures.append(f"{name}: no pinned oracle (run with --update-oracles)")
+            continue
+        if len(pinned[name]) != len(rows):
+            failures.append(f"{name}: {len(rows)} cases, {len(pinned[name])} pinned")
+            continue
+        for got, want in zip(rows, pinned[name]):
+            if got != want:
+                failures.append(f"{name}{tuple(got[:3])}: output set changed")
+    return failures
+
+
+def check_fast_paths(cases: list) -> list:
+    failures = []
+    for name, phone, symbols in cases:
+        expected = {c.encode("utf-8") for c in generate_variations(name, phone, symbols)}
+        if generate_variations_bytes(name, phone, symbols) != expected:
+            failures.append(f"generate_variations_bytes{(name, phone, symbols)}: differs from generate_variations")
+
+    # the fallback is the reference; the compiled module (if built) must match it,
+    # and both must accept bytearray/memoryview tokens like bytes
+    backends = {fastjoin._join_product, fastjoin.join_product}
+    for name, phone, symbols in cases:
+        pools = (
+            [name.encode("utf-8"), name[::-1].encode("utf-8")],
+            [s.encode("utf-8") for s in [""] + (symbols or [])],
+            [p.encode("utf-8") for p in chatgpt.phone_substrings(phone)],
+        )
+        wrapped = tuple([wrap(t) for t in pool] for pool, wrap in zip(pools, (bytearray, memoryview, bytearray)))
+        for min_len, max_len in ((0, 0), (8, 0), (8, 16)):
+            expected = fastjoin._join_product(*pools, min_len, max_len)
+            if any(join(*args, min_len, max_len) != expected for join in backends for args in (pools, wrapped)):
+                failures.append(f"join_product{(name, phone, symbols, min_len, max_len)}: backends differ")
+
+    # both backends must reject strided (non-contiguous) views the same way
+    strided = memoryview(b"abcdef")[::2]
+    for join in backends:
+        try:
+            join([strided], [b""], [b"x"])
+        except BufferError:
+            continue
+        failures.append(f"{join.__module__}.{join.__name__}: accepted a non-contiguous buffer")
+    return failures
+
+
+def check_wordlist_index() -> list:
+    """Build an index from ~2000 ten-line chunks with at most 64 open files."""
+    try:
+        import resource
+    except ImportError:  # not on Unix; build without lowering the limit
+        resource = None
+
+    rng = random.Random(SEED)
+    words = [str(rng.randint(0, 5000)) for _ in range(20000)]
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "words.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(words) + "\n")
+
+        if resource is not None:
+            soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+            resource.setrlimit(resource.RLIMIT_NOFILE, (min(64, hard), hard))
+        try:
+            wordlist_index.build_index(path, chunk_lines=10, index_dir=d)
+        except OSError as e:
+            return [f"wordlist_index.build_index: {e}"]
+        finally:
+            if resource is not None:
+                resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+
+        known = set(words)
+        with wordlist_index.WordlistIndex(path, d) as idx:
+            if any((str(i) in idx) != (str(i) in known) for i in range(-10, 5100)):
+                return ["wordlist_index.WordlistIndex: lookups differ from the wordlist"]
+        leftovers = [f for f in os.listdir(d) if f.endswith(".tmp")]
+        if leftovers:
+            return [f"wordlist_index.build_index: left temp files {leftovers}"]
+    return []
+
+
+def _bench_bases() -> list:
+    rng = random.Random(SEED)
+    return ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 10))) for _ in range(200)]
+
+
+def _run_variations(bases: list) -> int:
+    return sum(len(generate_variations(b, "9876543210")) for b in bases)
+
+
+def _run_variations_bytes(bases: list) -> int:
+    return sum(len(generate_variations_bytes(b, "9876543210")) for b in bases)
+
+
+def _run_chatgpt(bases: list) -> int:
+    return sum(len(chatgpt.generate_combinations(b, "9876543210")) for b in bases[:50])
+
+
+def _run_chatgpt2(bases: list) -> int:
+    return sum(len(chatgpt2.generate_combinations(b, "9876543210")) for b in bases[:50])
+
+
+def _run_multi_target(bases: list) -> int:
+    groups = multi_target.build_groups(bases[:3], ["14/03/1995"], ["tiger"], ["9876543210"])
+    return sum(1 for _ in multi_target.generate_multi(groups, limit=None))
+
+
+def _run_reference(bases: list) -> int:
+    # a fixed str-building loop shaped like the generators; never change it,
+    # every pinned ratio is relative to it
+    out = set()
+    for b in bases:
+        for sep in ("", "@", "_", "!", "#", "$"):
+            for n in range(40):
+                out.add(f"{b}{sep}{n}")
+    return len(out)
+
+
+BENCHMARKS = {
+    "generate_variations": _run_variations,
+    "generate_variations_bytes": _run_variations_bytes,
+    "chatgpt.generate_combinations": _run_chatgpt,
+    "chatgpt2.generate_combinations": _run_chatgpt2,
+    "multi_target.generate_multi": _run_multi_target,
+}
+
+
+def _best_rate(run, bases: list, best: float) -> float:
+    count = 0
+    start = time.perf_counter()
+    while True:
+        count += run(bases)
+        elapsed = time.perf_counter() - start
+        if elapsed >= BENCH_MIN_TIME:
+            return max(best, count / elapsed)
+
+
+def measure(run, bases: list) -> dict:
+    """Return speed relative to the reference loop and tracemalloc peak (KiB).
+
+    The benchmark and the reference alternate, best of BENCH_REPEAT each, so a
+    slower or busier machine slows both alike.
+    """
+    rate = ref = 0.0
+    for _ in range(BENCH_REPEAT):
+        ref = _best_rate(_run_reference, bases, ref)
+        rate = _best_rate(run, bases, rate)
+
+    tracemalloc.start()
+    run(bases)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"ratio": round(rate / ref, 3), "peak_kib": round(peak / 1024)}
+
+
+def backend() -> str:
+    return "extension" if fastjoin.HAVE_EXTENSION else "python"
+
+
+def compute_benchmarks() -> dict:
+    bases = _bench_bases()
+    return {name: measure(run, bases) for name, run in BENCHMARKS.items()}
+
+
+def pin_benchmarks() -> dict:
+    """Measure PIN_ROUNDS times and keep the slowest ratio and largest peak.
+
+    Pinning a lucky fast run would make later ordinary runs look like
+    regressions.
+    """
+    rounds = [compute_benchmarks() for _ in range(PIN_ROUNDS)]
+    return {
+        name: {
+            "ratio": min(r[name]["ratio"] for r in rounds),
+            "peak_kib": max(r[name]["peak_kib"] for r in rounds),
+        }
+        for name in BENCHMARKS
+    }
+
+
+def check_benchmarks(pinned: dict, max_slowdown: float, max_memory_growth: float) -> list:
+    """Compare against the numbers pinned for the active fastjoin backend."""
+    failures = []
+    pinned = pinned.get(backend(), {})
+    for name, got in compute_benchmarks().items():
+        want = pinned.get(name)
+        if want is None:
+            failures.append(f"{name}: no pinned benchmark for the {backend()} backend (run with --update-benchmarks)")
+            continue
+        print(f"  {name}: {got['ratio']}x reference (pinned {want['ratio']}x), peak {got['peak_kib']} KiB (pinned {want['peak_kib']})")
+        if got["ratio"] * max_slowdown < want["ratio"]:
+            failures.append(f"{name}: {got['ratio']}x reference speed, pinned {want['ratio']}x")
+        if got["peak_kib"] > want["peak_kib"] * max_memory_growth:
+            failures.append(f"{name}: peak {got['peak_kib']} KiB, pinned {want['peak_kib']} KiB")
+    return failures
+
+
+def _write_json(path: Path, data: dict) -> None:
+    path.write_text(json.dumps(data, indent=1, ensure_ascii=False) + "\n", encoding="utf-8")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check generator output sets and performance against pinned oracles.")
+    parser.add_argument("--update-oracles", action="store_true", help="Re-pin the output-set oracles instead of checking")
+    parser.add_argument("--update-benchmarks", action="store_true", help="Re-pin benchmarks for the active backend instead of checking")
+    parser.add_argument("--skip-perf", action="store_true", help="Only check output sets")
+    parser.add_argument("--oracles", default=str(ORACLE_FILE), help="Oracle file")
+    parser.add_argument("--benchmarks", default=str(BENCHMARK_FILE), help="Benchmark file")
+    parser.add_argument("--max-slowdown", type=float, default=MAX_SLOWDOWN, help="Fail if speed relative to the reference drops by more than this factor")
+    parser.add_argument("--max-memory-growth", type=float, default=MAX_MEMORY_GROWTH, help="Fail if peak memory grows by more than this factor")
+    args = parser.parse_args()
+
+    cases = make_cases()
+    oracle_path = Path(args.oracles)
+    bench_path = Path(args.benchmarks)
+
+    if args.update_oracles or args.update_benchmarks:
+        if args.update_oracles:
+            _write_json(oracle_path, compute_oracles(cases))
+            print(f"Pinned {len(cases)} cases to {oracle_path}")
+        if args.update_benchmarks:
+            pinned = json.loads(bench_path.read_text(encoding="utf-8")) if bench_path.exists() else {}
+            pinned[backend()] = pin_benchmarks()
+            _write_json(bench_path, pinned)
+            print(f"Pinned {backend()} benchmarks to {bench_path}")
+        return
+
+    failures = check_oracles(json.loads(oracle_path.read_text(encoding="utf-8")), cases)
+    failures += check_fast_paths(cases)
+    failures += check_wordlist_index()
+    if not args.skip_perf:
+        print(f"Benchmarks ({backend()} backend):")
+        pinned = json.loads(bench_path.read_text(encoding="utf-8")) if bench_path.exists() else {}
+        failures += check_benchmarks(pinned, args.max_slowdown, args.max_memory_growth)
+
+    if failures:
+        print(f"{len(failures)} check(s) failed:")
+        for f in failures:
+            print(" ", f)
+        sys.exit(1)
+    print(f"All checks passed ({len(cases)} cases).")
+
+
+if __name__ == "__main__":
+    main()
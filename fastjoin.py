@@ -0,0 +1,94 @@
+"""Join prefix x separator x suffix products into newline-terminated bytes.
+
+`join_product` is the hot inner loop of the generators. It uses the compiled
+`_fastjoin` extension when it has been built
+(`python setup.py build_ext --inplace`) and otherwise falls back to the pure
+Python version below, which produces byte-for-byte identical output.
+`HAVE_EXTENSION` tells which one is in use.
+
+Tokens may be any C-contiguous bytes-like objects (`bytes`, `bytearray`,
+`memoryview`); both backends raise `BufferError` for strided views.
+Lengths passed as `min_len`/`max_len` count characters, not bytes, so UTF-8
+tokens are filtered exactly like the equivalent `str` candidates.
+
+`write_lines` writes already-encoded candidates through one reusable buffer.
+"""
+WRITE_BUFFER_SIZE = 1 << 16
+
+
+def _char_len(token: bytes) -> int:
+    if token.isascii():
+        return len(token)
+    # UTF-8 continuation bytes (0b10xxxxxx) do not start a character
+    return len(token) - sum(1 for c in token if c & 0xC0 == 0x80)
+
+
+def _as_bytes(token) -> bytes:
+    # mirror the C module, which reads any object exposing a contiguous byte buffer
+    if type(token) is bytes:
+        return token
+    view = memoryview(token)
+    if not view.c_contiguous:
+        raise BufferError("memoryview: underlying buffer is not C-contiguous")
+    return view.tobytes()
+
+
+def _join_product(prefixes, seps, suffixes, min_len: int = 0, max_len: int = 0) -> bytes:
+    """Return every `prefix + sep + suffix + b"\\n"` whose length is in range.
+
+    Output order is prefixes, then separators, then suffixes. `max_len` of 0
+    means no upper bound.
+    """
+    out = bytearray()
+    seps = [(s, _char_len(s)) for s in map(_as_bytes, seps)]
+    suf = [(t, _char_len(t)) for t in map(_as_bytes, suffixes)]
+    for p in map(_as_bytes, prefixes):
+        lp = _char_len(p)
+        for s, ls in seps:
+            head = p + s
+            lh = lp + ls
+            for t, lt in suf:
+                n = lh + lt
+                if n >= min_len and (max_len <= 0 or n <= max_len):
+                    out += head
+                    out += t
+                    out += b"\n"
+    return bytes(out)
+
+
+try:
+    from _fastjoin import join_product
+
+    HAVE_EXTENSION = True
+except ImportError:
+    join_product = _join_product
+    HAVE_EXTENSION = False
+
+
+def write_lines(f, items, buffer_size: int = WRITE_BUFFER_SIZE) -> int:
+    """Write bytes items newline-terminated to binary file `f`; return the count.
+
+    Items are copied into a single reusable buffer and written out as slices of
+    it, so no per-line objects are created on the way to the file.
+    """
+    buf = bytearray(buffer_size)
+    view = memoryview(buf)
+    pos = 0
+    count = 0
+    for it in items:
+        n = len(it) + 1
+        if pos + n > buffer_size:
+            f.write(view[:pos])
+            pos = 0
+            if n > buffer_size:
+                f.write(it)
+                f.write(b"\n")
+                count += 1
+                continue
+        buf[pos:pos + n - 1] = it
+        buf[pos + n - 1] = 0x0A
+        pos += n
+        count += 1
+    if pos:
+        f.write(view[:pos])
+    return count
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""Combine tokens from several people, dates, keywords and phones.
+
+Each input value (a name, a date, a keyword or a phone number) expands into a
+small group of scored forms, e.g. `sourav` -> `sourav`, `Sourav`, `SOURAV` or
+`14/03/1995` -> `1403`, `1995`, `95`, `14031995`. The engine joins up to
+`--max-tokens` forms from distinct groups with a separator and streams the
+candidates that pass the length and score limits, stopping at `--limit`.
+Candidates found in any `--exclude-wordlist` file are skipped.
+
+Example:
+    python multi_target.py -n sourav -n riya -d 14/03/1995 -k tiger -p 9876543210
+"""
+import argparse
+import re
+from typing import Iterator
+
+from password_generator import clean_phone
+from wordlist_index import Exclusions
+
+OUTPUT_FILE = "passwords.txt"
+
+SEPARATORS = ["", "@", "_", ".", "#", "-"]
+
+MIN_LEN = 8
+MAX_LEN = 16
+MAX_TOKENS = 3
+MIN_SCORE = 0.1
+LIMIT = 100000
+
+# base weight per token kind; a combination scores the product of its parts
+KIND_WEIGHTS = {
+    "name": 1.0,
+    "keyword": 0.8,
+    "date": 0.7,
+    "phone": 0.6,
+}
+
+# separators other than "" make a combination slightly less likely
+SEPARATOR_WEIGHT = 0.9
+
+
+def title_case(s: str) -> str:
+    return s[:1].upper() + s[1:].lower() if s else s
+
+
+def word_forms(word: str, weight: float) -> list:
+    """Return (form, score) pairs for lower, title and upper case."""
+    word = (word or "").strip()
+    if not word:
+        return []
+    forms = {word.lower(): weight, title_case(word): weight * 0.9, word.upper(): weight * 0.5}
+    return list(forms.items())
+
+
+def date_forms(date: str, weight: float) -> list:
+    """Split a day/month/year date into DDMM, YYYY, YY and DDMMYYYY forms.
+
+    Accepts `DD/MM/YYYY`, `DD-MM-YYYY`, `DD.MM.YYYY`, `YYYY-MM-DD` or a plain
+    `DDMMYYYY` digit string. Anything else is used as a plain digit token.
+    """
+    parts = [p for p in re.split(r"[^0-9]+", date or "") if p]
+    if len(parts) == 1 and len(parts[0]) == 8:
+        p = parts[0]
+        parts = [p[:2], p[2:4], p[4:]]
+    if len(parts) != 3:
+        digits = "".join(parts)
+        return [(digits, weight)] if digits else []
+
+    if len(parts[0]) == 4:
+        year, month, day = parts
+    else:
+        day, month, year = parts
+    day, month = day.zfill(2), month.zfill(2)
+    if len(year) == 2:
+        year = ("19" if int(year) > 30 else "20") + year
+
+    forms = {
+        f"{day}{month}": weight,
+        year: weight,
+        year[-2:]: weight * 0.6,
+        f"{day}{month}{year}": weight * 0.8,
+        f"{day}{month}{year[-2:]}": weight * 0.6,
+    }
+    return list(forms.items())
+
+
+def phone_forms(phone: str, weight: float) -> list:
+    """Return the full number plus its common prefixes and suffixes."""
+    p = clean_phone(phone or "")
+    if not p:
+        return []
+    forms = {p: weight}
+    for n in (4, 3):
+        if len(p) > n:
+            forms.setdefault(p[-n:], weight * 0.9)
+            forms.setdefault(p[:n], weight * 0.7)
+    return list(forms.items())
+
+
+def build_groups(
+    names: list | None = None,
+    dates: list | None = None,
+    keywords: list | None = None,
+    phones: list | None = None,
+) -> list:
+    """Expand raw inputs into token groups.
+
+    Every input value becomes one group: a list of (form, score) pairs. A
+    combination never uses two forms from the same group.
+    """
+    groups = []
+    for kind, values, expand in (
+        ("name", names, word_forms),
+        ("keyword", keywords, word_forms),
+        ("date", dates, date_forms),
+        ("phone", phones, phone_forms),
+    ):
+        for value in values or []:
+            forms = expand(value, KIND_WEIGHTS[kind])
+            if forms:
+                groups.append(forms)
+    return groups
+
+
+def generate_multi(
+    groups: list,
+    separators: list | None = None,
+    max_tokens: int = MAX_TOKENS,
+    min_len: int = MIN_LEN,
+    max_len: int = MAX_LEN,
+    min_score: float = MIN_SCORE,
+    limit: int | None = LIMIT,
+    exclude=None,
+) -> Iterator[str]:
+    """Yield unique combinations of 1..max_tokens forms from distinct groups.
+
+    Candidates are emitted by token count, fewest tokens first. Partial combinations
+    are pruned as soon as they exceed `max_len` or fall below `min_score`, so
+    the search only walks branches that can still produce output. Stops after
+    `limit` candidates (`None` or 0 for no cap). Candidates contained in
+    `exclude` are skipped and do not count toward the limit.
+    """
+    if separators is None:
+        separators = SEPARATORS
+    seen: set = set()
+
+    # shortest form per group, used to prune branches that can never fit
+    shortest = [min(len(f) for f, _ in g) for g in groups]
+
+    def extend(prefix: str, score: float, used: int, sep: str, remaining: int) -> Iterator[str]:
+        for gi, group in enumerate(groups):
+            if used & (1 << gi):
+                continue
+            for form, weight in group:
+                s = score * weight
+                if s < min_score:
+                    continue
+                cand = f"{prefix}{sep}{form}" if prefix else form
+                if len(cand) > max_len:
+                    continue
+                if remaining == 1:
+                    if len(cand) >= min_len:
+                        yield cand
+                    continue
+                # at least one more form (plus separator) must still fit
+                room = max_len - len(cand) - len(sep)
+                if all(used & (1 << gj) or gj == gi or shortest[gj] > room for gj in range(len(groups))):
+                    continue
+                yield from extend(cand, s, used | (1 << gi), sep, remaining - 1)
+
+    for k in range(1, min(max_tokens, len(groups)) + 1):
+        for sep in (separators if k > 1 else [""]):
+            sep_score = 1.0 if not sep else SEPARATOR_WEIGHT
+            for cand in extend("", sep_score, 0, sep, k):
+                if cand in seen or (exclude is not None and cand in exclude):
+                    continue
+                seen.add(cand)
+                yield cand
+                if limit and len(seen) >= limit:
+                    return
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Combine names, dates, keywords and phones into password-like candidates."
+    )
+    parser.add_argument("--name", "-n", action="append", default=[], help="Person or pet name (repeatable)")
+    parser.add_argument("--date", "-d", action="append", default=[], help="Date such as 14/03/1995 (repeatable)")
+    parser.add_argument("--keyword", "-k", action="append", default=[], help="Keyword such as a company (repeatable)")
+    parser.add_argument("--phone", "-p", action="append", default=[], help="Phone number (repeatable)")
+    parser.add_argument("--out", "-o", help="Output file", default=OUTPUT_FILE)
+    parser.add_argument("--separators", "-s", help="Separator characters (e.g. '@_.'). Empty separator is always used.")
+    parser.add_argument("--max-tokens", type=int, default=MAX_TOKENS, help="Most tokens joined per candidate")
+    parser.add_argument("--min-len", type=int, default=MIN_LEN, help="Minimum candidate length")
+    parser.add_argument("--max-len", type=int, default=MAX_LEN, help="Maximum candidate length")
+    parser.add_argument("--min-score", type=float, default=MIN_SCORE, help="Drop combinations scoring below this")
+    parser.add_argument("--limit", type=int, default=LIMIT, help="Stop after this many candidates (0 for no cap)")
+    parser.add_argument("--exclude-wordlist", action="append", default=[], metavar="PATH", help="Skip candidates already in this wordlist (repeatable)")
+    parser.add_argument("--index-dir", help="Directory for --exclude-wordlist indexes (default: user cache dir)")
+    args = parser.parse_args()
+
+    groups = build_groups(args.name, args.date, args.keyword, args.phone)
+    if not groups:
+        print("No tokens given. Use --name, --date, --keyword or --phone.")
+        return
+
+    separators = None
+    if args.separators:
+        separators = [""] + [c for c in dict.fromkeys(args.separators) if c]
+
+    count = 0
+    with Exclusions(args.exclude_wordlist, args.index_dir) as exclude, open(args.out, "w", encoding="utf-8") as f:
+        for cand in generate_multi(
+            groups,
+            separators=separators,
+            max_tokens=args.max_tokens,
+            min_len=args.min_len,
+            max_len=args.max_len,
+            min_score=args.min_score,
+            limit=args.limit,
+            exclude=exclude if args.exclude_wordlist else None,
+        ):
+            f.write(cand + "\n")
+            count += 1
+
+    print(f"Wrote {count} passwords to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
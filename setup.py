@@ -0,0 +1,13 @@
+"""Build the optional `_fastjoin` accelerator in place.
+
+    python setup.py build_ext --inplace
+
+The scripts work without it; see fastjoin.py.
+"""
+from setuptools import Extension, setup
+
+setup(
+    name="p-gen-fastjoin",
+    ext_modules=[Extension("_fastjoin", ["_fastjoin.c"])],
+    py_modules=[],
+)
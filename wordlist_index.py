@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""Sorted on-disk wordlist index for excluding already-known candidates.
+
+A wordlist is turned into a `.sorted` index file holding its unique lines in
+byte order. The sort runs as an external merge: fixed-size chunks are sorted
+in memory and spilled to temporary files, which are merged with `heapq.merge`
+at most `MERGE_FAN_IN` at a time, pass after pass, until one file is left. A
+multi-GB master list never has to fit in memory and never needs more than
+`MERGE_FAN_IN` + 1 open files. Lookups `mmap` the sorted
+file and binary-search it, leaving paging to the OS.
+
+Indexes live in a cache directory (`$XDG_CACHE_HOME/p-gen/wordlists` or
+`~/.cache/p-gen/wordlists`, override with `--index-dir`), so read-only or
+shared wordlists are never written to or next to. A path that already ends in
+`.sorted` is used as-is. Each index starts with a header line recording the
+wordlist's size, mtime and inode; it is rebuilt whenever any of them differ,
+so a replaced wordlist is picked up even if its mtime went backwards (`cp -p`,
+`rsync -a`, `tar x`). It can also be built ahead of time:
+
+    python wordlist_index.py master.txt
+"""
+import argparse
+import hashlib
+import heapq
+import mmap
+import os
+import tempfile
+
+INDEX_SUFFIX = ".sorted"
+# the leading NUL sorts the header before every word, so the file stays sorted
+HEADER_MAGIC = b"\0p-gen-index"
+CHUNK_LINES = 1_000_000
+# kept well below the common `ulimit -n` of 1024 (and even 64)
+MERGE_FAN_IN = 32
+
+
+def _read_lines(f):
+    for line in f:
+        line = line.rstrip(b"\r\n")
+        if line:
+            yield line
+
+
+def _write_sorted(lines, f) -> None:
+    prev = None
+    for line in lines:
+        if line != prev:
+            f.write(line + b"\n")
+            prev = line
+
+
+def _spill(lines, out_dir: str, temps: list) -> str:
+    """Write sorted `lines` deduplicated to a new temp file; return its path."""
+    with tempfile.NamedTemporaryFile(dir=out_dir, prefix="chunk.", suffix=".tmp", delete=False) as f:
+        temps.append(f.name)
+        _write_sorted(lines, f)
+    return f.name
+
+
+def _iter_file(path: str):
+    with open(path, "rb") as f:
+        yield from _read_lines(f)
+
+
+def _source_stamp(path: str) -> bytes:
+    st = os.stat(path)
+    return b"%s size=%d mtime_ns=%d ino=%d\n" % (HEADER_MAGIC, st.st_size, st.st_mtime_ns, st.st_ino)
+
+
+def _read_stamp(index: str) -> bytes | None:
+    try:
+        with open(index, "rb") as f:
+            line = f.readline()
+    except FileNotFoundError:
+        return None
+    return line if line.startswith(HEADER_MAGIC) else None
+
+
+def default_index_dir() -> str:
+    cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache, "p-gen", "wordlists")
+
+
+def index_path(path: str, index_dir: str | None = None) -> str:
+    """Return where the index for `path` lives inside `index_dir`."""
+    if path.endswith(INDEX_SUFFIX):
+        return path
+    abspath = os.path.abspath(path)
+    # the path hash keeps same-named wordlists from different directories apart
+    key = hashlib.sha1(abspath.encode("utf-8", "surrogateescape")).hexdigest()[:16]
+    name = f"{os.path.basename(abspath)}.{key}{INDEX_SUFFIX}"
+    return os.path.join(index_dir or default_index_dir(), name)
+
+
+def build_index(
+    path: str,
+    out: str | None = None,
+    chunk_lines: int = CHUNK_LINES,
+    index_dir: str | None = None,
+    fan_in: int = MERGE_FAN_IN,
+) -> str:
+    """Write the unique lines of `path` in sorted byte order to `out`."""
+    # stamped before reading, so a wordlist changed mid-build is rebuilt next time
+    stamp = _source_stamp(path)
+    out = out or index_path(path, index_dir)
+    out_dir = os.path.dirname(os.path.abspath(out))
+    os.makedirs(out_dir, exist_ok=True)
+    fan_in = max(fan_in, 2)
+    # chunk files stay closed until merged, so open files never exceed fan_in + 1
+    chunks = []
+    temps = []  # every temp file still on disk, removed in `finally`
+    try:
+        with open(path, "rb") as src:
+            lines = _read_lines(src)
+            while True:
+                chunk = [line for _, line in zip(range(chunk_lines), lines)]
+                if not chunk:
+                    break
+                chunk.sort()
+                chunks.append(_spill(chunk, out_dir, temps))
+
+        while len(chunks) > fan_in:
+            merged = []
+            for i in range(0, len(chunks), fan_in):
+                group = chunks[i:i + fan_in]
+                merged.append(_spill(heapq.merge(*(_iter_file(p) for p in group)), out_dir, temps))
+            for p in chunks:
+                os.unlink(p)
+                temps.remove(p)
+            chunks = merged
+
+        # a unique temp name lets concurrent runs build the same index safely
+        with tempfile.NamedTemporaryFile(
+            dir=out_dir, prefix=os.path.basename(out) + ".", suffix=".tmp", delete=False
+        ) as f:
+            temps.append(f.name)
+            f.write(stamp)
+            _write_sorted(heapq.merge(*(_iter_file(p) for p in chunks)), f)
+        os.replace(f.name, out)
+        temps.remove(f.name)
+    finally:
+        for p in temps:
+            try:
+                os.unlink(p)
+            except FileNotFoundError:
+                pass
+    return out
+
+
+def ensure_index(path: str, index_dir: str | None = None) -> str:
+    """Return the index for `path`, building it if missing or stale."""
+    out = index_path(path, index_dir)
+    if out == path:
+        return out
+    if _read_stamp(out) != _source_stamp(path):
+        build_index(path, out)
+    return out
+
+
+class WordlistIndex:
+    """Membership test against a sorted index file via mmap binary search."""
+
+    def __init__(self, path: str, index_dir: str | None = None):
+        self.path = ensure_index(path, index_dir)
+        self._file = open(self.path, "rb")
+        self._size = os.fstat(self._file.fileno()).st_size
+        # mmap cannot map an empty file
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self._size else None
+        # skip the header line of indexes built here; prebuilt .sorted files have none
+        self._start = 0
+        if self._mm is not None and self._mm[:len(HEADER_MAGIC)] == HEADER_MAGIC:
+            self._start = self._mm.find(b"\n") + 1 or self._size
+
+    def __contains__(self, word) -> bool:
+        if self._mm is None:
+            return False
+        if isinstance(word, str):
+            word = word.encode("utf-8")
+        mm = self._mm
+        lo, hi = self._start, self._size
+        # `lo` always sits at the start of a line; search lines starting in [lo, hi)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            nl = mm.rfind(b"\n", lo, mid)
+            start = lo if nl < 0 else nl + 1
+            end = mm.find(b"\n", start)
+            if end < 0:
+                end = self._size
+            line = mm[start:end]
+            if line == word:
+                return True
+            if line < word:
+                lo = end + 1
+            else:
+                hi = start
+        return False
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class Exclusions:
+    """A candidate is excluded if any of the wordlist indexes contains it."""
+
+    def __init__(self, paths: list, index_dir: str | None = None):
+        self.indexes = [WordlistIndex(p, index_dir) for p in paths]
+
+    def __contains__(self, word) -> bool:
+        if self.indexes and isinstance(word, str):
+            word = word.encode("utf-8")
+        return any(word in idx for idx in self.indexes)
+
+    def close(self) -> None:
+        for idx in self.indexes:
+            idx.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build sorted indexes for --exclude-wordlist.")
+    parser.add_argument("wordlists", nargs="+", help="Wordlist files to index")
+    parser.add_argument("--chunk-lines", type=int, default=CHUNK_LINES, help="Lines sorted in memory per chunk")
+    parser.add_argument("--index-dir", help="Directory for index files (default: user cache dir)")
+    args = parser.parse_args()
+
+    for path in args.wordlists:
+        out = build_index(path, chunk_lines=args.chunk_lines, index_dir=args.index_dir)
+        print(f"Indexed {path} -> {out}")
+
+
+if __name__ == "__main__":
+    main()